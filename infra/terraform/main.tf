@@ -122,6 +122,29 @@ resource "aws_s3_bucket_server_side_encryption_configuration" "outputs" {
   }
 }
 
+# Row hand-off files written by read_sheet under runs/ are only needed while a
+# run fans out, so expire them (and their noncurrent versions) after a week.
+resource "aws_s3_bucket_lifecycle_configuration" "outputs" {
+  bucket = aws_s3_bucket.outputs.id
+
+  rule {
+    id     = "expire-run-handoff-files"
+    status = "Enabled"
+
+    filter {
+      prefix = "runs/"
+    }
+
+    expiration {
+      days = 7
+    }
+
+    noncurrent_version_expiration {
+      noncurrent_days = 1
+    }
+  }
+}
+
 # App registry table
 resource "aws_dynamodb_table" "sheet_watch_registry" {
   name         = "SheetWatchRegistry-${var.env}"
@@ -290,9 +313,11 @@ resource "aws_lambda_function" "send_report" {
 
   environment {
     variables = {
-      APP_ENV                 = var.env
-      POWERTOOLS_SERVICE_NAME = "event-forge-${var.env}"
-      SLACK_WEBHOOK_URL       = "unset"
+      APP_ENV                     = var.env
+      POWERTOOLS_SERVICE_NAME     = "event-forge-${var.env}"
+      SLACK_WEBHOOK_URL           = "unset"
+      # Log the full (potentially large) report event only in dev
+      POWERTOOLS_LOGGER_LOG_EVENT = var.env == "dev" ? "true" : "false"
     }
   }
 }
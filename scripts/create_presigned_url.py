@@ -1,66 +1,110 @@
 # scripts/create_presigned_url.py
 
-import argparse
 import logging
-import boto3
-from botocore.exceptions import ClientError
+import os
+import sys
+from pathlib import Path
+
+# Make the project root importable so the script shares src/common with the Lambdas
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.common import aws
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def create_url(bucket: str, object_name: str, expiration: int, method: str) -> str:
+def create_url(bucket: str, object_name: str, expiration: int, method: str, region: str = None) -> str:
     """
     Generates a pre-signed URL for an S3 object using the user's local AWS credentials.
 
+    Signing goes through `src.common.aws`, which resolves credentials once and
+    caches the signer per bucket, so generating many URLs in one process does
+    not rebuild a boto3 client per call.
+
     Args:
         bucket (str): The name of the S3 bucket.
         object_name (str): The key of the object in the S3 bucket.
         expiration (int): The URL's expiration time in seconds.
         method (str): The HTTP method ('GET' or 'PUT').
+        region (str): The region the bucket lives in. Defaults to the AWS
+                      profile's region, then us-east-1.
 
     Returns:
         str: The pre-signed URL, or an error message if generation fails.
     """
-    s3_client = boto3.client('s3')
-    http_method_map = {
-        "GET": "get_object",
-        "PUT": "put_object",
-    }
-    client_method = http_method_map.get(method.upper())
-
-    if not client_method:
+    if method.upper() not in ("GET", "PUT"):
         return "Error: Invalid HTTP method specified. Use 'GET' or 'PUT'."
 
-    try:
-        url = s3_client.generate_presigned_url(
-            ClientMethod=client_method,
-            Params={'Bucket': bucket, 'Key': object_name},
-            ExpiresIn=expiration
-        )
-        return url
-    except ClientError as e:
-        logger.error(f"Failed to generate pre-signed URL: {e}")
-        return f"Error: Could not generate URL. Check your AWS credentials and permissions. Details: {e}"
+    url = aws.create_presigned_url(bucket, object_name, expiration=expiration, method=method, region=region)
+    if not url:
+        return "Error: Could not generate URL. Check your AWS credentials."
+    return url
+
+USAGE = """usage: create_presigned_url.py --bucket BUCKET --key KEY [--method {GET,PUT}] [--expires SECONDS] [--region REGION]
+
+Generate a pre-signed S3 URL.
+
+  --bucket   The name of the S3 bucket.
+  --key      The object key (path/to/file.ext) in the bucket.
+  --method   The HTTP method (GET or PUT). Default is PUT.
+  --expires  Expiration time in seconds. Default is 3600 (1 hour).
+  --region   The bucket's AWS region. Default is $AWS_REGION or $AWS_DEFAULT_REGION."""
+
+def _usage_error(message: str):
+    """Exits with the usage text and an error message, like argparse does."""
+    sys.exit(f"{USAGE}\n\nerror: {message}")
+
+def parse_args(argv: list) -> dict:
+    """
+    Parses `--name value` / `--name=value` options into a dict.
+
+    A tiny hand-rolled parser: importing and building an argparse parser costs
+    more than signing the URL itself now that signing is done locally.
+    Exits with the usage text on unknown or missing options.
+    """
+    args = {
+        "method": "PUT",
+        "expires": "3600",
+        "region": os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION"),
+    }
+    it = iter(argv)
+    for arg in it:
+        if arg in ("-h", "--help"):
+            print(USAGE)
+            sys.exit(0)
+        name, sep, value = arg.partition("=")
+        name = name[2:] if name.startswith("--") else ""
+        if name not in ("bucket", "key", "method", "expires", "region"):
+            _usage_error(f"unrecognized argument: {arg}")
+        if not sep:
+            value = next(it, None)
+            if value is None:
+                _usage_error(f"argument --{name}: expected a value")
+        args[name] = value
+
+    missing = [f"--{name}" for name in ("bucket", "key") if name not in args]
+    if missing:
+        _usage_error(f"the following arguments are required: {', '.join(missing)}")
+    if args["method"] not in ("GET", "PUT"):
+        _usage_error(f"argument --method: invalid choice: '{args['method']}'")
+    if not args["expires"].isdigit():
+        _usage_error(f"argument --expires: invalid int value: '{args['expires']}'")
+    args["expires"] = int(args["expires"])
+    return args
 
 def main():
     """Main function to parse arguments and generate the URL."""
-    parser = argparse.ArgumentParser(description="Generate a pre-signed S3 URL.")
-    parser.add_argument("--bucket", required=True, help="The name of the S3 bucket.")
-    parser.add_argument("--key", required=True, help="The object key (path/to/file.ext) in the bucket.")
-    parser.add_argument("--method", default="PUT", choices=["GET", "PUT"], help="The HTTP method (GET or PUT). Default is PUT.")
-    parser.add_argument("--expires", type=int, default=3600, help="Expiration time in seconds. Default is 3600 (1 hour).")
-
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
 
-    logger.info(f"Generating a {args.method} URL for s3://{args.bucket}/{args.key}...")
-    url = create_url(args.bucket, args.key, args.expires, args.method)
+    logger.info(f"Generating a {args['method']} URL for s3://{args['bucket']}/{args['key']}...")
+    url = create_url(args["bucket"], args["key"], args["expires"], args["method"], args["region"])
     print("\n" + "="*80)
     if "Error:" in url:
         print(f" FAILED\n {url}")
     else:
-        print(f" SUCCESS!\n\nPre-signed URL (expires in {args.expires} seconds):\n{url}")
-        if args.method == "PUT":
+        print(f" SUCCESS!\n\nPre-signed URL (expires in {args['expires']} seconds):\n{url}")
+        if args["method"] == "PUT":
             print(f"\nExample usage with curl:\ncurl --upload-file \"/path/to/your/local/file.pdf\" \"{url}\"")
     print("="*80)
 
@@ -1,9 +1,13 @@
 # src/common/adobe.py
 
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -11,9 +15,25 @@ logger = logging.getLogger(__name__)
 # Constants for the Adobe APIs
 IMS_URL = "https://ims-na1.adobelogin.com/ims/token/v3"
 INDESIGN_API_BASE_URL = "https://indesign.adobe.io"
+# The Rendition API can accept data for merging just like the Data Merge API
+RENDITION_ENDPOINT = f"{INDESIGN_API_BASE_URL}/v1/jobs/rendition"
 # The scope required for InDesign API access
 API_SCOPE = "openid,AdobeID,indesign_services,creative_cloud,creative_sdk"
 
+# Clients are cached per client ID so warm Lambda invocations reuse the
+# underlying connection pool instead of paying a TLS handshake per call.
+_clients: Dict[str, "AdobeClient"] = {}
+
+# IMS access tokens are valid for ~24 hours. They are cached per client ID as
+# (access_token, expires_at) so that warm invocations skip the IMS round trip.
+# `expires_at` is on the time.monotonic() clock.
+_token_cache: Dict[str, Tuple[str, float]] = {}
+# Refresh this many seconds before IMS says the token expires
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+# (connect, read) timeouts in seconds for every Adobe call, so a stalled
+# connection fails fast instead of running into the 15 s Lambda timeout
+HTTP_TIMEOUT = (3.05, 10)
+
 
 class AdobeClient:
     """
@@ -24,6 +44,13 @@ class AdobeClient:
         rendition jobs, and checking their status.
     """
 
+    # Fixed parts of the rendition payload; only the hrefs and data vary per job
+    _INPUT_SPEC = {
+        "storage": "EXTERNAL",
+        "type": "application/vnd.adobe.indesign-template",
+    }
+    _OUTPUT_SPEC = {"storage": "EXTERNAL", "type": "application/pdf"}
+
     def __init__(self, client_id: str, client_secret: str):
         """
         Initializes the AdobeClient.
@@ -36,13 +63,36 @@ class AdobeClient:
         self.client_secret = client_secret
         self.access_token = None
 
+        # A single pooled session keeps connections to IMS and the InDesign API
+        # alive between calls (e.g. across status polls).
+        self._session = requests.Session()
+        # Throttling and transient server errors are retried for GET only, with
+        # a short, capped backoff that fits inside the Lambda timeout. POST is
+        # left out of the default allowed_methods so a rendition job the server
+        # may already have accepted is never submitted twice.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                backoff_max=1.0,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {"x-api-key": self.client_id, "Content-Type": "application/json"}
+        )
+
     def _authenticate(self) -> bool:
         """
         Retrieves an OAuth 2.0 access token from Adobe's Identity Management System (IMS).
 
         Purpose:
             To get a short-lived access token required for all subsequent API calls.
-            This token is stored on the client instance.
+            This token is stored on the client instance and in the module-level
+            token cache, together with its expiry.
 
         Returns:
             bool: True if authentication was successful, False otherwise.
@@ -55,10 +105,23 @@ class AdobeClient:
         }
         try:
             logger.info("Requesting new Adobe API access token.")
-            response = requests.post(IMS_URL, data=payload)
+            # The form-encoded token request must not inherit the session's
+            # JSON content type or a previous bearer token.
+            response = self._session.post(
+                IMS_URL,
+                data=payload,
+                headers={"Content-Type": None, "Authorization": None},
+                timeout=HTTP_TIMEOUT,
+            )
             response.raise_for_status()
             token_data = response.json()
-            self.access_token = token_data["access_token"]
+            expires_at = (
+                time.monotonic()
+                + float(token_data.get("expires_in", 0))
+                - TOKEN_EXPIRY_MARGIN_SECONDS
+            )
+            _token_cache[self.client_id] = (token_data["access_token"], expires_at)
+            self._set_token(token_data["access_token"])
             logger.info("Successfully retrieved Adobe API access token.")
             return True
         except requests.exceptions.RequestException as e:
@@ -67,13 +130,29 @@ class AdobeClient:
                 logger.error(f"Adobe IMS Response: {e.response.text}")
             return False
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Constructs the required headers for API calls."""
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "x-api-key": self.client_id,
-            "Content-Type": "application/json",
-        }
+    def _set_token(self, access_token: str) -> None:
+        """Stores the access token on the instance and the session headers."""
+        self.access_token = access_token
+        self._session.headers["Authorization"] = f"Bearer {access_token}"
+
+    def ensure_token(self) -> bool:
+        """
+        Makes sure the client holds an unexpired access token.
+
+        Purpose:
+            To reuse a cached IMS token for as long as it is valid and only
+            call `_authenticate` once it is missing or about to expire. Handlers
+            may call this ahead of time to authenticate during Lambda init.
+
+        Returns:
+            bool: True if a valid token is available, False otherwise.
+        """
+        cached = _token_cache.get(self.client_id)
+        if cached is not None and time.monotonic() < cached[1]:
+            if self.access_token != cached[0]:
+                self._set_token(cached[0])
+            return True
+        return self._authenticate()
 
     def submit_rendition_job(
         self, template_url: str, output_url: str, data: Dict[str, Any]
@@ -93,30 +172,23 @@ class AdobeClient:
         Returns:
             Optional[str]: The job status URL if submission was successful, otherwise None.
         """
-        if not self.access_token and not self._authenticate():
+        if not self.ensure_token():
             return None  # Failed to get a token
 
-        # The Rendition API can accept data for merging just like the Data Merge API
-        rendition_endpoint = f"{INDESIGN_API_BASE_URL}/v1/jobs/rendition"
         payload = {
-            "input": {
-                "storage": "EXTERNAL",
-                "href": template_url,
-                "type": "application/vnd.adobe.indesign-template",
-            },
+            "input": {**self._INPUT_SPEC, "href": template_url},
             "data": {"storage": "INLINE", "json": data},
-            "output": {
-                "storage": "EXTERNAL",
-                "href": output_url,
-                "type": "application/pdf",
-            },
+            "output": {**self._OUTPUT_SPEC, "href": output_url},
         }
 
         try:
             logger.info("Submitting rendition job to Adobe InDesign API.")
-            logger.debug(f"Adobe API Payload: {payload}")
-            response = requests.post(
-                rendition_endpoint, headers=self._get_headers(), json=payload
+            # Lazy %-formatting: the payload is only rendered if DEBUG is enabled
+            logger.debug("Adobe API Payload: %s", payload)
+            # Serialize with orjson instead of letting requests run json.dumps;
+            # the session already sends Content-Type: application/json.
+            response = self._session.post(
+                RENDITION_ENDPOINT, data=orjson.dumps(payload), timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
 
@@ -149,16 +221,16 @@ class AdobeClient:
                                         Common statuses are 'running', 'succeeded', 'failed'.
                                         Returns None on communication error.
         """
-        if not self.access_token and not self._authenticate():
+        if not self.ensure_token():
             return None  # Failed to get a token
 
         try:
             logger.info(f"Checking status for job: {job_url}")
-            response = requests.get(job_url, headers=self._get_headers())
+            response = self._session.get(job_url, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
 
             status_data = response.json()
-            logger.debug(f"Received status data: {status_data}")
+            logger.debug("Received status data: %s", status_data)
             return status_data
 
         except requests.exceptions.RequestException as e:
@@ -166,3 +238,26 @@ class AdobeClient:
             if e.response is not None:
                 logger.error(f"Adobe API Response: {e.response.text}")
             return None
+
+
+def get_client(client_id: str, client_secret: str) -> AdobeClient:
+    """
+    Returns a cached AdobeClient for the given credentials.
+
+    Purpose:
+        Lambda handlers should call this instead of constructing AdobeClient
+        directly, so that the HTTP connection pool and access token survive
+        across warm invocations of the same container.
+
+    Args:
+        client_id (str): The Adobe API Client ID (API Key).
+        client_secret (str): The Adobe API Client Secret.
+
+    Returns:
+        AdobeClient: The cached client, created on first use.
+    """
+    client = _clients.get(client_id)
+    if client is None or client.client_secret != client_secret:
+        client = AdobeClient(client_id=client_id, client_secret=client_secret)
+        _clients[client_id] = client
+    return client
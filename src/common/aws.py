@@ -1,40 +1,133 @@
 # src/common/aws.py
 
+import datetime
+import functools
+import hashlib
+import hmac
 import logging
-from typing import Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from urllib.parse import quote
 
-import boto3
-from botocore.exceptions import ClientError
+if TYPE_CHECKING:
+    import boto3
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-# Initialize boto3 clients globally to reuse connections
+# boto3 session and clients are built lazily on first use and then kept in
+# module globals, so warm invocations reuse them (and their connection pools).
+# Building a client is the expensive part; never create one inside a handler.
+# boto3 itself is imported on first use too, since importing it is a large
+# share of cold-start time for code paths that never touch AWS APIs.
 # The region will be sourced from the Lambda environment variable AWS_REGION
-session = boto3.Session()
-secrets_manager_client = session.client("secretsmanager")
-s3_client = session.client("s3")
+_session: Optional["boto3.Session"] = None
+_secrets_manager_client = None
+_s3_client = None
+_clients_lock = threading.Lock()
 
+# Secret values are cached as (value, expires_at) on the time.monotonic() clock,
+# so a warm container re-reads a secret at most once per TTL.
+SECRETS_CACHE_TTL_SECONDS = 300
+_secrets_cache: Dict[str, Tuple[str, float]] = {}
+# BatchGetSecretValue accepts at most 20 secret IDs per request
+SECRETS_BATCH_SIZE = 20
 
-def get_secret(secret_name: str) -> Optional[str]:
+# SigV4 constants for query-string (pre-signed) S3 requests
+SIGV4_ALGORITHM = "AWS4-HMAC-SHA256"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+# Region signed for when neither the caller nor the environment names one,
+# matching boto3's fallback for S3
+DEFAULT_S3_REGION = "us-east-1"
+
+# One presigner per (bucket, region), built on first use and reused across
+# warm invocations
+_presigners: Dict[Tuple[str, str], "S3Presigner"] = {}
+_presigners_lock = threading.Lock()
+
+
+def get_session() -> "boto3.Session":
+    """Returns the shared boto3 session, creating it on first use."""
+    global _session
+    if _session is None:
+        import boto3
+
+        with _clients_lock:
+            if _session is None:
+                _session = boto3.Session()
+    return _session
+
+
+def get_s3_client():
+    """Returns the shared S3 client, creating it on first use."""
+    global _s3_client
+    if _s3_client is None:
+        session = get_session()
+        with _clients_lock:
+            if _s3_client is None:
+                _s3_client = session.client("s3")
+    return _s3_client
+
+
+def get_secrets_manager_client():
+    """Returns the shared Secrets Manager client, creating it on first use."""
+    global _secrets_manager_client
+    if _secrets_manager_client is None:
+        session = get_session()
+        with _clients_lock:
+            if _secrets_manager_client is None:
+                _secrets_manager_client = session.client("secretsmanager")
+    return _secrets_manager_client
+
+
+def _get_cached_secret(secret_name: str) -> Optional[str]:
+    """Returns a cached secret value if it has not expired yet."""
+    cached = _secrets_cache.get(secret_name)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+    return None
+
+
+def _cache_secret(secret_name: str, value: str) -> None:
+    """Stores a secret value in the module-level TTL cache."""
+    _secrets_cache[secret_name] = (
+        value,
+        time.monotonic() + SECRETS_CACHE_TTL_SECONDS,
+    )
+
+
+def get_secret(secret_name: str, force_refresh: bool = False) -> Optional[str]:
     """
     Retrieves a secret string from AWS Secrets Manager.
 
     Purpose:
         To securely fetch credentials or configuration stored in Secrets Manager.
         This function assumes the execution role has the necessary IAM permissions.
+        Values are cached for SECRETS_CACHE_TTL_SECONDS.
 
     Args:
         secret_name (str): The name or ARN of the secret to retrieve.
+        force_refresh (bool): Skip the cache and read the current value, e.g.
+                              after the cached credentials were rejected.
 
     Returns:
         Optional[str]: The secret string if found, otherwise None.
     """
+    if not force_refresh:
+        cached = _get_cached_secret(secret_name)
+        if cached is not None:
+            return cached
+
+    from botocore.exceptions import ClientError
+
     try:
-        get_secret_value_response = secrets_manager_client.get_secret_value(
+        get_secret_value_response = get_secrets_manager_client().get_secret_value(
             SecretId=secret_name
         )
-        return get_secret_value_response["SecretString"]
+        secret_string = get_secret_value_response["SecretString"]
+        _cache_secret(secret_name, secret_string)
+        return secret_string
     except ClientError as e:
         logger.error(f"Failed to retrieve secret '{secret_name}': {e}")
         # Depending on the error code, you might want to handle different exceptions
@@ -42,8 +135,287 @@ def get_secret(secret_name: str) -> Optional[str]:
         return None
 
 
+def get_secrets(secret_names: List[str]) -> Dict[str, str]:
+    """
+    Retrieves several secret strings from AWS Secrets Manager at once.
+
+    Purpose:
+        To fetch up to 20 secrets per `BatchGetSecretValue` round trip instead
+        of one `GetSecretValue` call each. Cached values are served without a
+        request, and fetched values are added to the same cache as `get_secret`.
+
+    Args:
+        secret_names (List[str]): The names or ARNs of the secrets to retrieve.
+
+    Returns:
+        Dict[str, str]: The secret strings keyed by the name or ARN they were
+                        requested with. Secrets that could not be retrieved are
+                        missing from the result and logged as errors.
+    """
+    secrets: Dict[str, str] = {}
+    missing: List[str] = []
+    for secret_name in secret_names:
+        cached = _get_cached_secret(secret_name)
+        if cached is not None:
+            secrets[secret_name] = cached
+        else:
+            missing.append(secret_name)
+
+    if not missing:
+        return secrets
+
+    from botocore.exceptions import ClientError
+
+    client = get_secrets_manager_client()
+    for start in range(0, len(missing), SECRETS_BATCH_SIZE):
+        batch = missing[start : start + SECRETS_BATCH_SIZE]
+        requested = set(batch)
+        request = {"SecretIdList": batch}
+        try:
+            while True:
+                response = client.batch_get_secret_value(**request)
+                for entry in response.get("SecretValues", []):
+                    if "SecretString" not in entry:
+                        continue
+                    # Key by whichever identifier the caller used
+                    key = entry["Name"] if entry["Name"] in requested else entry["ARN"]
+                    secrets[key] = entry["SecretString"]
+                    _cache_secret(key, entry["SecretString"])
+                for error in response.get("Errors", []):
+                    logger.error(
+                        f"Failed to retrieve secret '{error.get('SecretId')}': "
+                        f"{error.get('ErrorCode')} {error.get('Message')}"
+                    )
+                if not response.get("NextToken"):
+                    break
+                request["NextToken"] = response["NextToken"]
+        except ClientError as e:
+            logger.error(f"Failed to retrieve secrets {batch}: {e}")
+
+    return secrets
+
+
+def put_object(
+    bucket: str, key: str, body: bytes, content_type: str = "application/octet-stream"
+) -> bool:
+    """
+    Uploads a bytes payload to S3.
+
+    Purpose:
+        To hand large results to the next workflow step through S3 instead of
+        inlining them in a Lambda response.
+
+    Args:
+        bucket (str): The name of the S3 bucket.
+        key (str): The object key to write.
+        body (bytes): The object contents.
+        content_type (str): The Content-Type stored with the object.
+
+    Returns:
+        bool: True if the object was written, False otherwise.
+    """
+    from botocore.exceptions import ClientError
+
+    try:
+        get_s3_client().put_object(
+            Bucket=bucket, Key=key, Body=body, ContentType=content_type
+        )
+        return True
+    except ClientError as e:
+        logger.error(f"Failed to write s3://{bucket}/{key}: {e}")
+        return False
+
+
+def _hmac_sha256(key: bytes, msg: str) -> bytes:
+    """Returns the raw HMAC-SHA256 digest of `msg` under `key`."""
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+@functools.lru_cache(maxsize=8)
+def _derive_signing_key(secret: bytes, date_stamp: str, region: str) -> bytes:
+    """
+    Derives the daily SigV4 signing key for S3.
+
+    Memoized so that presigners for different buckets in the same region
+    (e.g. assets and outputs) share one derivation per day.
+    """
+    k_date = _hmac_sha256(secret, date_stamp)
+    k_region = _hmac_sha256(k_date, region)
+    k_service = _hmac_sha256(k_region, "s3")
+    return _hmac_sha256(k_service, "aws4_request")
+
+
+class S3Presigner:
+    """
+    A hand-rolled AWS Signature Version 4 signer for S3 pre-signed URLs.
+
+    Purpose:
+        Generating a URL through boto3 runs botocore's endpoint resolution and
+        signer machinery on every call. Everything except the object key and
+        the timestamp is constant for a given bucket, so this class computes
+        the host, the query-string template and the daily signing key once.
+        Each URL then costs one string format, one SHA-256 and one HMAC.
+
+    Note:
+        The credentials are frozen when the presigner is created. This matches
+        the Lambda runtime, where the execution role credentials are fixed for
+        the lifetime of the container.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        region: str,
+        access_key: str,
+        secret_key: str,
+        session_token: Optional[str] = None,
+    ):
+        """
+        Initializes the S3Presigner.
+
+        Args:
+            bucket (str): The name of the S3 bucket.
+            region (str): The AWS region the bucket lives in.
+            access_key (str): The AWS access key ID.
+            secret_key (str): The AWS secret access key.
+            session_token (Optional[str]): The session token for temporary
+                                           credentials (e.g., a Lambda role).
+        """
+        self.bucket = bucket
+        self.region = region
+        self.access_key = access_key
+        # Virtual-hosted URLs put the bucket in the TLS host name, so a bucket
+        # name with dots would not match the *.s3 wildcard certificate. Those
+        # buckets are addressed path-style instead.
+        if "." in bucket:
+            self.host = f"s3.{region}.amazonaws.com"
+            self._path_prefix = "/" + quote(bucket, safe="")
+        else:
+            self.host = f"{bucket}.s3.{region}.amazonaws.com"
+            self._path_prefix = ""
+        self._secret = ("AWS4" + secret_key).encode("utf-8")
+        self._scope_suffix = f"/{region}/s3/aws4_request"
+
+        # The query string is sorted by parameter name as SigV4 requires.
+        # Only the date stamp, timestamp and expiry change between URLs.
+        self._query_prefix = (
+            f"X-Amz-Algorithm={SIGV4_ALGORITHM}"
+            f"&X-Amz-Credential={quote(access_key, safe='')}%2F"
+        )
+        self._query_scope = quote(self._scope_suffix, safe="")
+        self._query_suffix = "&X-Amz-SignedHeaders=host"
+        if session_token:
+            self._query_suffix = (
+                f"&X-Amz-Security-Token={quote(session_token, safe='')}"
+                + self._query_suffix
+            )
+        self._canonical_suffix = f"host:{self.host}\n\nhost\n{UNSIGNED_PAYLOAD}"
+
+        self._date_stamp: Optional[str] = None
+        self._signing_key = b""
+
+    def _get_signing_key(self, date_stamp: str) -> bytes:
+        """
+        Returns the SigV4 signing key for the given day, looking it up again
+        only when the date rolls over.
+        """
+        if date_stamp != self._date_stamp:
+            self._signing_key = _derive_signing_key(
+                self._secret, date_stamp, self.region
+            )
+            self._date_stamp = date_stamp
+        return self._signing_key
+
+    def presign(self, key: str, method: str = "GET", expires: int = 3600) -> str:
+        """
+        Generates a pre-signed URL for an object in this presigner's bucket.
+
+        Args:
+            key (str): The key of the object in the S3 bucket.
+            method (str): The HTTP method ('GET' or 'PUT'). Defaults to 'GET'.
+            expires (int): The URL's expiration time in seconds. Defaults to 3600.
+
+        Returns:
+            str: The pre-signed URL.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+
+        path = f"{self._path_prefix}/{quote(key, safe='/')}"
+        query = (
+            f"{self._query_prefix}{date_stamp}{self._query_scope}"
+            f"&X-Amz-Date={amz_date}&X-Amz-Expires={expires}{self._query_suffix}"
+        )
+        canonical_request = (
+            f"{method.upper()}\n{path}\n{query}\n{self._canonical_suffix}"
+        )
+        string_to_sign = (
+            f"{SIGV4_ALGORITHM}\n{amz_date}\n{date_stamp}{self._scope_suffix}\n"
+            f"{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
+        )
+        signature = hmac.new(
+            self._get_signing_key(date_stamp),
+            string_to_sign.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"https://{self.host}{path}?{query}&X-Amz-Signature={signature}"
+
+
+def get_presigner(bucket: str, region: Optional[str] = None) -> Optional[S3Presigner]:
+    """
+    Returns the cached S3Presigner for a bucket, creating it on first use.
+
+    Purpose:
+        To resolve credentials from the default boto3 credential chain once per
+        bucket and container, rather than once per URL.
+
+    Args:
+        bucket (str): The name of the S3 bucket.
+        region (Optional[str]): The region the bucket lives in. Defaults to the
+                                session's region, then to DEFAULT_S3_REGION.
+
+    Returns:
+        Optional[S3Presigner]: The presigner, or None if no AWS credentials
+                               could be resolved.
+    """
+    session = get_session()
+    region = region or session.region_name or DEFAULT_S3_REGION
+    presigner = _presigners.get((bucket, region))
+    if presigner is not None:
+        return presigner
+
+    with _presigners_lock:
+        presigner = _presigners.get((bucket, region))
+        if presigner is not None:
+            return presigner
+
+        credentials = session.get_credentials()
+        if credentials is None:
+            logger.error(
+                f"Cannot create pre-signer for bucket '{bucket}': "
+                "AWS credentials are not configured."
+            )
+            return None
+
+        frozen = credentials.get_frozen_credentials()
+        presigner = S3Presigner(
+            bucket=bucket,
+            region=region,
+            access_key=frozen.access_key,
+            secret_key=frozen.secret_key,
+            session_token=frozen.token,
+        )
+        _presigners[(bucket, region)] = presigner
+        return presigner
+
+
 def create_presigned_url(
-    bucket: str, object_name: str, expiration: int = 3600, method: str = "GET"
+    bucket: str,
+    object_name: str,
+    expiration: int = 3600,
+    method: str = "GET",
+    region: Optional[str] = None,
 ) -> Optional[str]:
     """
     Generates a pre-signed URL for an S3 object.
@@ -51,40 +423,27 @@ def create_presigned_url(
     Purpose:
         To provide secure, time-limited access to S3 objects without
         exposing credentials. Can be used for both GET (downloads) and
-        PUT (uploads).
+        PUT (uploads). Signing is done locally by the bucket's cached
+        S3Presigner, so no botocore machinery runs per URL.
 
     Args:
         bucket (str): The name of the S3 bucket.
         object_name (str): The key of the object in the S3 bucket.
         expiration (int): The URL's expiration time in seconds. Defaults to 3600.
         method (str): The HTTP method ('GET' or 'PUT'). Defaults to 'GET'.
+        region (Optional[str]): The region the bucket lives in. Defaults to the
+                                session's region, then to DEFAULT_S3_REGION.
 
     Returns:
         Optional[str]: The pre-signed URL if generated successfully, otherwise None.
     """
-    http_method_map = {
-        "GET": "get_object",
-        "PUT": "put_object",
-    }
-    client_method = http_method_map.get(method.upper())
-
-    if not client_method:
+    if method.upper() not in ("GET", "PUT"):
         logger.error(f"Invalid HTTP method '{method}' for pre-signed URL.")
         return None
 
-    try:
-        params = {"Bucket": bucket, "Key": object_name}
-        if method.upper() == "PUT":
-            # You can add content-type restrictions for uploads if needed
-            # params['ContentType'] = 'application/pdf'
-            pass
-
-        url = s3_client.generate_presigned_url(
-            ClientMethod=client_method, Params=params, ExpiresIn=expiration
-        )
-        return url
-    except ClientError as e:
-        logger.error(
-            f"Failed to generate pre-signed URL for {bucket}/{object_name}: {e}"
-        )
+    presigner = get_presigner(bucket, region)
+    if presigner is None:
+        logger.error(f"Failed to generate pre-signed URL for {bucket}/{object_name}.")
         return None
+
+    return presigner.presign(object_name, method=method, expires=expiration)
@@ -1,14 +1,15 @@
 # src/common/config.py
 
+import functools
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict
 
 from src.common.logging import logger
 
-_config_cache: Optional[Dict[str, Any]] = None
+# The project root, resolved once at import. Path.resolve() stats the file
+# system, so it is kept off the load path. (src/common/config.py -> root)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
 def load_config() -> Dict[str, Any]:
@@ -21,7 +22,8 @@ def load_config() -> Dict[str, Any]:
         The function determines the environment (e.g., 'dev', 'staging', 'prod')
         from the `APP_ENV` OS environment variable, finds the corresponding
         `config/<env>.yaml` file, and loads it. The loaded configuration is
-        cached to avoid repeated file I/O in the same Lambda execution context.
+        cached per environment to avoid repeated file I/O in the same Lambda
+        execution context.
 
     Returns:
         Dict[str, Any]: A dictionary containing the application configuration.
@@ -30,36 +32,46 @@ def load_config() -> Dict[str, Any]:
         FileNotFoundError: If the required configuration file does not exist.
         ValueError: If the APP_ENV environment variable is not set.
     """
-    global _config_cache
-    if _config_cache:
-        logger.debug("Returning cached configuration.")
-        return _config_cache
-
     # Determine the environment (dev, staging, prod)
     env = os.environ.get("APP_ENV")
     if not env:
         raise ValueError("APP_ENV environment variable is not set.")
 
+    return _load_config_cached(env)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(env: str) -> Dict[str, Any]:
+    """
+    Reads and parses `config/<env>.yaml`, memoized per environment.
+
+    Failures are not cached, so a missing or malformed file is retried on the
+    next call. Tests can reset the cache with `_load_config_cached.cache_clear()`.
+    """
+    # PyYAML is only needed on this (once per environment) path.
+    import yaml
+
+    # Prefer the libyaml-backed loader, which parses several times faster than
+    # the pure-Python one. PyYAML builds without libyaml fall back transparently.
+    safe_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     logger.info(f"Loading configuration for environment: {env}")
 
     # Construct the path to the config file.
     # We assume the code is run from the root of the project or that the
     # 'config' directory is in the python path.
-    # Path(__file__).resolve().parent.parent.parent gives us the project root.
-    project_root = Path(__file__).resolve().parent.parent.parent
-    config_path = project_root / "config" / f"{env}.yaml"
+    config_path = PROJECT_ROOT / "config" / f"{env}.yaml"
 
     if not config_path.is_file():
         logger.error(f"Configuration file not found at path: {config_path}")
         raise FileNotFoundError(f"Config file not found for env '{env}'")
 
-    # Load the YAML file
-    with open(config_path, "r") as f:
-        try:
-            config_data = yaml.safe_load(f)
-            _config_cache = config_data
-            logger.info("Successfully loaded and cached configuration.")
-            return config_data
-        except yaml.YAMLError as e:
-            logger.error(f"Error parsing YAML file {config_path}: {e}")
-            raise
+    # Read the file in one call and parse the bytes in one shot, rather than
+    # letting the parser pull from an open file handle in chunks.
+    try:
+        config_data = yaml.load(config_path.read_bytes(), Loader=safe_loader)
+        logger.info("Successfully loaded and cached configuration.")
+        return config_data
+    except yaml.YAMLError as e:
+        logger.error(f"Error parsing YAML file {config_path}: {e}")
+        raise
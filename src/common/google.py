@@ -1,13 +1,13 @@
 # src/common/google.py
 
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from google.auth import aws
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+# The Google client libraries are imported inside the functions that use them,
+# so importing this module for its constants stays cheap at cold start.
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -16,10 +16,14 @@ logger = logging.getLogger(__name__)
 DRIVE_READONLY_SCOPE = "https://www.googleapis.com/auth/drive.readonly"
 SHEETS_READONLY_SCOPE = "https://www.googleapis.com/auth/spreadsheets.readonly"
 
+# Credentials are cached per (service account, sorted scopes) so that warm
+# invocations skip the AWS -> GCP token exchange until the token expires.
+_gcp_creds_cache: Dict[Tuple[str, Tuple[str, ...]], "Credentials"] = {}
+
 
 def get_google_credentials(
     gcp_service_account_email: str, scopes: List[str]
-) -> Optional[Credentials]:
+) -> Optional["Credentials"]:
     """
     Generates Google Cloud credentials using AWS Workload Identity Federation.
 
@@ -27,6 +31,7 @@ def get_google_credentials(
         To securely authenticate with Google Cloud APIs from an AWS environment
         (like Lambda) without using a static service account key file. It exchanges
         the Lambda's IAM role credentials for Google Cloud credentials.
+        The credentials are cached and only refreshed once their token expires.
 
     Args:
         gcp_service_account_email (str): The email of the Google Cloud Service
@@ -36,6 +41,23 @@ def get_google_credentials(
     Returns:
         Optional[Credentials]: A Google credentials object if successful, else None.
     """
+    from google.auth import aws
+    from google.auth.transport.requests import Request
+
+    cache_key = (gcp_service_account_email, tuple(sorted(scopes)))
+    cached = _gcp_creds_cache.get(cache_key)
+    if cached is not None:
+        if cached.valid:
+            return cached
+        try:
+            logger.info("Refreshing expired Google credentials.")
+            cached.refresh(Request())
+            return cached
+        except Exception as e:
+            logger.error(f"Failed to refresh Google credentials: {e}")
+            del _gcp_creds_cache[cache_key]
+            return None
+
     try:
         logger.info(
             "Generating Google credentials via AWS Workload Identity Federation."
@@ -54,14 +76,87 @@ def get_google_credentials(
         # The credentials need to be refreshed to be usable.
         creds.refresh(Request())
         logger.info("Successfully generated Google credentials.")
+        _gcp_creds_cache[cache_key] = creds
         return creds
     except Exception as e:
         logger.error(f"Failed to generate Google credentials: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=8)
+def get_sheets_service(creds: "Credentials") -> Any:
+    """
+    Builds the Sheets API service for a credentials object, memoized per
+    credentials instance. Lambdas can call this during init to have the
+    service ready before the first invocation.
+
+    The discovery document is read from the copy bundled with
+    google-api-python-client (`static_discovery=True`) instead of being fetched
+    over HTTP, and the file-based discovery cache is disabled.
+    """
+    from googleapiclient.discovery import build
+
+    return build(
+        "sheets",
+        "v4",
+        credentials=creds,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
+def read_google_sheets_batch(
+    creds: "Credentials",
+    spreadsheet_id: str,
+    ranges: List[str],
+    value_render_option: str = "FORMATTED_VALUE",
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Reads several ranges of a Google Sheet in a single API call.
+
+    Purpose:
+        To fetch N ranges with one `spreadsheets.values.batchGet` round trip
+        instead of N separate `values.get` calls.
+
+    Args:
+        creds (Credentials): The authenticated Google credentials object.
+        spreadsheet_id (str): The ID of the Google Sheet to read.
+        ranges (List[str]): The ranges to read, e.g., ["Sheet1!A:Z", "Sheet2!A:C"].
+        value_render_option (str): How cells are rendered. "UNFORMATTED_VALUE"
+                                   returns numbers and booleans as native types.
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: The raw `valueRanges` from the API, in the
+                                        same order as `ranges`, or None if an
+                                        error occurs.
+    """
+    from googleapiclient.errors import HttpError
+
+    try:
+        service = get_sheets_service(creds)
+        result = (
+            service.spreadsheets()
+            .values()
+            .batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                majorDimension="ROWS",
+                valueRenderOption=value_render_option,
+            )
+            .execute()
+        )
+        return result.get("valueRanges", [])
+
+    except HttpError as e:
+        logger.error(f"Google Sheets API error: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"An unexpected error occurred while reading the sheet: {e}")
+        return None
+
+
 def read_google_sheet(
-    creds: Credentials, spreadsheet_id: str, sheet_range: str = "A:Z"
+    creds: "Credentials", spreadsheet_id: str, sheet_range: str = "A:Z"
 ) -> Optional[List[Dict[str, Any]]]:
     """
     Reads data from a Google Sheet and returns it as a list of dictionaries.
@@ -81,43 +176,34 @@ def read_google_sheet(
         Optional[List[Dict[str, Any]]]: A list of dictionaries representing the rows,
                                         or None if an error occurs.
     """
+    logger.info(f"Connecting to Google Sheets API for spreadsheet: {spreadsheet_id}")
+    # A single-range batchGet: one round trip, and further ranges can be added
+    # to the same call later without extra requests. Cells are read formatted
+    # (as displayed in the sheet), so every value arrives as a string.
+    value_ranges = read_google_sheets_batch(creds, spreadsheet_id, [sheet_range])
+    if value_ranges is None:
+        return None
+
     try:
-        logger.info(
-            f"Connecting to Google Sheets API for spreadsheet: {spreadsheet_id}"
-        )
-        service = build("sheets", "v4", credentials=creds)
-        sheet = service.spreadsheets()
-        result = (
-            sheet.values()
-            .get(spreadsheetId=spreadsheet_id, range=sheet_range)
-            .execute()
-        )
-        values = result.get("values", [])
+        values = value_ranges[0].get("values", []) if value_ranges else []
 
         if not values:
             logger.warning(f"Google Sheet '{spreadsheet_id}' appears to be empty.")
             return []
 
         # The first row is the header, which will become the keys for our dicts.
-        header = [h.strip() for h in values[0]]
-        # The rest of the rows are the data.
-        data_rows = values[1:]
-
-        # Create a list of dictionaries
-        records = []
-        for row in data_rows:
-            # Create a dict for the row, padding with None if row is shorter than header
-            row_data = dict(zip(header, row))
-            # Only add non-empty rows
-            if any(row_data.values()):
-                records.append(row_data)
+        header = tuple(h.strip() for h in values[0])
+
+        # Build one dict per data row, skipping rows with no non-empty cells.
+        # The check runs on the raw row, so no dict is built for skipped rows.
+        # The API trims trailing empty cells, so short rows simply omit those
+        # keys rather than being padded with None (which would fail the
+        # schema's type checks for optional columns).
+        records = [dict(zip(header, row)) for row in values[1:] if any(row)]
 
         logger.info(f"Successfully read {len(records)} records from the sheet.")
         return records
 
-    except HttpError as e:
-        logger.error(f"Google Sheets API error: {e}")
-        return None
     except Exception as e:
         logger.error(f"An unexpected error occurred while reading the sheet: {e}")
         return None
@@ -1,5 +1,7 @@
 # src/common/logging.py
 
+import threading
+
 from aws_lambda_powertools import Logger
 
 # ==============================================================================
@@ -15,8 +17,9 @@ from aws_lambda_powertools import Logger
 # How it Works:
 #   1. We initialize the Logger here at the module level.
 #   2. In our Lambda handlers, we will load our environment-specific config
-#      (e.g., from dev.yaml) and pass the service name and log level to this
-#      logger instance.
+#      (e.g., from dev.yaml) and pass the service name and log level to
+#      `configure_logger`, which applies them once per process no matter how
+#      many handler modules (or test imports) call it.
 #   3. Powertools automatically injects contextual information like the Lambda
 #      request ID, cold start status, and memory usage into every log record.
 #
@@ -29,3 +32,25 @@ from aws_lambda_powertools import Logger
 # ==============================================================================
 
 logger = Logger()
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def configure_logger(service: str, level: str) -> None:
+    """
+    Applies the service name and log level to the shared logger, once.
+
+    Args:
+        service (str): The Powertools service name for all log records.
+        level (str): The log level, e.g. "INFO" or "DEBUG".
+    """
+    global _configured
+    if _configured:
+        return
+    with _configure_lock:
+        if _configured:
+            return
+        logger.set_service(service)
+        logger.set_level(level)
+        _configured = True
@@ -0,0 +1,24 @@
+# src/common/responses.py
+
+from typing import Any, Dict
+
+import orjson
+
+
+def build_response(status: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Builds a Lambda proxy response with an orjson-encoded body.
+
+    Purpose:
+        Every handler returns the same {'statusCode', 'body'} shape to the
+        Inngest orchestrator. Building it here keeps the encoding in one place
+        instead of repeating orjson.dumps(...).decode() at each exit.
+
+    Args:
+        status (int): The HTTP status code of the response.
+        body (Dict[str, Any]): The response payload, serialized to a JSON string.
+
+    Returns:
+        Dict[str, Any]: A standard Lambda proxy response.
+    """
+    return {"statusCode": status, "body": orjson.dumps(body).decode()}
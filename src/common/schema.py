@@ -1,51 +1,89 @@
 # src/common/schema.py
 
-from typing import Any, Dict
+from itertools import compress
+from typing import Annotated, Any, Dict, List, Tuple, Union
 
-from jsonschema import ValidationError, validate
+import msgspec
 
 from src.common.logging import logger
 
 
-def validate_row_data(data: Dict[str, Any], schema: Dict[str, Any]) -> bool:
+class ProductRow(msgspec.Struct, forbid_unknown_fields=True):
     """
-    Validates a dictionary of row data against a given JSON schema.
+    A single product row, mirroring `schemas/product_row.schema.json`.
+
+    The JSON schema remains the documented data contract; this Struct encodes the
+    same rules so rows can be checked by msgspec's C validator. Keep both in sync.
+    """
+
+    sku: Annotated[str, msgspec.Meta(pattern=r"^[A-Z0-9-]{3,20}$")]
+    product_name: Annotated[str, msgspec.Meta(min_length=3, max_length=100)]
+    price: Union[Annotated[float, msgspec.Meta(ge=0)], str]
+    # The JSON schema's "uri" format, as fastjsonschema checks it (`\Z`, unlike
+    # `$`, does not match before a trailing newline)
+    image_url: Annotated[str, msgspec.Meta(pattern=r"^\w+:(\/?\/?)[^\s]+\Z")]
+    is_active: bool
+    description: Annotated[str, msgspec.Meta(max_length=500)] = ""
+    category: str = ""
+
+
+def validate_product_row(data: Dict[str, Any]) -> bool:
+    """
+    Validates a single product row against the `ProductRow` Struct.
 
     Purpose:
-        To ensure that data read from the Google Sheet conforms to our
-        predefined data contract (`product_row.schema.json`) before it is
-        processed further down the pipeline. This prevents bad data from
-        triggering downstream failures.
+        The read_sheet Lambda only needs to know whether each row is valid.
+        `msgspec.convert` checks the row in C and stops at the first error,
+        which is much cheaper than interpreting the JSON schema per row,
+        especially on sheets with many bad rows.
 
     Args:
         data (Dict[str, Any]): The dictionary representing a single row of data.
-        schema (Dict[str, Any]): The JSON schema to validate against.
 
     Returns:
-        bool: True if the data is valid according to the schema, False otherwise.
+        bool: True if the row matches `ProductRow`, False otherwise.
     """
     try:
-        validate(instance=data, schema=schema)
-        logger.debug("Row data validation successful.", extra={"data": data})
+        msgspec.convert(data, ProductRow)
         return True
-    except ValidationError as e:
-        # We log this as a warning because it's an expected failure mode for
-        # bad data, not a system error.
+    except msgspec.ValidationError as e:
+        # Expected failure mode for bad data, not a system error
         logger.warning(
             "Row data failed validation.",
-            extra={
-                "data": data,
-                "error_message": e.message,
-                "validator": e.validator,
-                "validator_value": e.validator_value,
-                "path": list(e.path),
-            },
-        )
-        return False
-    except Exception as e:
-        # Catch any other unexpected errors during validation.
-        logger.error(
-            "An unexpected error occurred during schema validation.",
-            extra={"error": str(e)},
+            extra={"data": data, "error_message": str(e)},
         )
         return False
+
+
+def partition_product_rows(
+    rows: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Splits sheet rows into valid and invalid product rows.
+
+    Purpose:
+        Most sheets are entirely valid, so the whole list is first checked in a
+        single `msgspec.convert` call, which runs the loop over rows in C. Only
+        if that fails are rows checked one by one to find (and log) the bad ones.
+        Rows stay as dicts: a columnar (pyarrow/pandas) table would not beat
+        this C pass at sheet sizes, and would add a large dependency to the
+        Lambda package and its cold start.
+
+    Args:
+        rows (List[Dict[str, Any]]): The rows read from the sheet.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]: The valid rows and the
+                                                           invalid rows, in sheet order.
+    """
+    try:
+        msgspec.convert(rows, List[ProductRow])
+        return rows, []
+    except msgspec.ValidationError:
+        pass
+
+    # Validate each row once, then split with C-level compress() passes
+    is_valid = [validate_product_row(row) for row in rows]
+    valid_rows = list(compress(rows, is_valid))
+    invalid_rows = list(compress(rows, [not ok for ok in is_valid]))
+    return valid_rows, invalid_rows
@@ -1,11 +1,14 @@
 # src/lambdas/generate_poster/handler.py
 
-import json
-from typing import Any, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
 
 # Import our common modules
 from src.common import adobe, aws, config
-from src.common.logging import logger
+from src.common.logging import configure_logger, logger
+from src.common.responses import build_response
 
 # ==============================================================================
 # Global Scope: Load configuration once per container reuse
@@ -15,13 +18,111 @@ try:
     app_config = config.load_config()
 
     # Inject service name and log level from config into the logger
-    logger.set_service(app_config["logging"]["powertools_service_name"])
-    logger.set_level(app_config["logging"]["level"])
+    configure_logger(
+        app_config["logging"]["powertools_service_name"],
+        app_config["logging"]["level"],
+    )
 
 except (ValueError, FileNotFoundError) as e:
     logger.error("FATAL: Could not load configuration.", extra={"error": str(e)})
     app_config = None
 
+
+# ==============================================================================
+# Adobe Client: fetched and authenticated once per container
+# ==============================================================================
+
+
+def _load_adobe_client(
+    rejected_client: Optional[adobe.AdobeClient] = None,
+) -> Tuple[Optional[adobe.AdobeClient], Optional[str]]:
+    """
+    Fetches the Adobe API credentials and returns an authenticated client.
+
+    Args:
+        rejected_client (Optional[adobe.AdobeClient]): A client that just failed
+            to authenticate. The secret is then read past the cache, and if it
+            has not changed, the load fails without asking IMS again.
+
+    Returns:
+        Tuple[Optional[adobe.AdobeClient], Optional[str]]: The client and None on
+            success, or None and an error message for the response body.
+    """
+    # We assume the secret contains a JSON string with 'client_id' and 'client_secret' keys
+    adobe_secret_name = app_config["aws"]["secrets_manager"]["adobe_api_key_name"]
+    adobe_creds_str = aws.get_secret(
+        adobe_secret_name, force_refresh=rejected_client is not None
+    )
+    if not adobe_creds_str:
+        logger.error("Failed to retrieve Adobe API credentials from Secrets Manager.")
+        return None, "Could not fetch Adobe credentials"
+
+    try:
+        adobe_creds = orjson.loads(adobe_creds_str)
+        client_id = adobe_creds["client_id"]
+        client_secret = adobe_creds["client_secret"]
+    except (orjson.JSONDecodeError, KeyError):
+        logger.error("Adobe secret is not a valid JSON or is missing keys.")
+        return None, "Malformed Adobe credentials secret"
+
+    # get_client hands back the same instance while the credentials are unchanged
+    adobe_client = adobe.get_client(client_id=client_id, client_secret=client_secret)
+    if adobe_client is rejected_client or not adobe_client.ensure_token():
+        logger.error("Failed to authenticate with Adobe IMS.")
+        return None, "Could not authenticate with Adobe"
+    return adobe_client, None
+
+
+_adobe_client: Optional[adobe.AdobeClient] = None
+_adobe_client_future: Optional[Future] = None
+_assets_signer: Optional[aws.S3Presigner] = None
+_outputs_signer: Optional[aws.S3Presigner] = None
+
+if app_config:
+    # boto3 Sessions are not thread-safe, so everything that touches the shared
+    # session (resolving credentials for the pre-signers, creating the Secrets
+    # Manager client) happens here on the main thread first. Clients are
+    # thread-safe, so the background thread only uses the finished client.
+    _assets_signer = aws.get_presigner(
+        app_config["aws"]["s3"]["assets_bucket_name"], app_config["aws"]["region"]
+    )
+    _outputs_signer = aws.get_presigner(
+        app_config["aws"]["s3"]["outputs_bucket_name"], app_config["aws"]["region"]
+    )
+    aws.get_secrets_manager_client()
+
+    # Fetch the secret and the IMS token in the background for the rest of
+    # init; the handler joins the result on its first invocation.
+    _init_executor = ThreadPoolExecutor(max_workers=1)
+    _adobe_client_future = _init_executor.submit(_load_adobe_client)
+
+
+def _get_adobe_client() -> Tuple[Optional[adobe.AdobeClient], Optional[str]]:
+    """
+    Returns the container's Adobe client, joining the init-time load on first
+    use. Failures are not cached, so the next invocation tries again. If the
+    kept client can no longer get a token (e.g. the client_secret was rotated),
+    it is dropped and the credentials are read from Secrets Manager again,
+    past the secrets cache, so a rotated secret is picked up.
+    """
+    global _adobe_client, _adobe_client_future
+    rejected_client = _adobe_client
+    if rejected_client is not None:
+        if rejected_client.ensure_token():
+            return rejected_client, None
+        logger.warning("Adobe authentication failed; reloading credentials.")
+        _adobe_client = None
+
+    if _adobe_client_future is not None:
+        future, _adobe_client_future = _adobe_client_future, None
+        adobe_client, error = future.result()
+    else:
+        adobe_client, error = _load_adobe_client(rejected_client)
+
+    _adobe_client = adobe_client
+    return adobe_client, error
+
+
 # ==============================================================================
 # Lambda Handler
 # ==============================================================================
@@ -35,7 +136,8 @@ def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
     Purpose:
         This function is triggered by an Inngest event containing a single,
         validated row of data. It generates pre-signed URLs for the template
-        and output, fetches the Adobe API key, and submits a rendition job.
+        and output, and submits a rendition job with the Adobe client that was
+        authenticated during Lambda init.
         It returns the job URL for Inngest to poll.
 
     Args:
@@ -49,10 +151,7 @@ def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
     """
     if not app_config:
         logger.error("Handler cannot execute due to missing configuration.")
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Internal server configuration error"}),
-        }
+        return build_response(500, {"error": "Internal server configuration error"})
 
     # 1. Extract row data and SKU from the incoming event
     try:
@@ -70,83 +169,51 @@ def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
         logger.warning(
             "Incoming event is missing or has malformed data.", extra={"error": str(e)}
         )
-        return {
-            "statusCode": 400,
-            "body": json.dumps({"error": f"Invalid event data: {e}"}),
-        }
-
-    # 2. Fetch Adobe API credentials from AWS Secrets Manager
-    # We assume the secret contains a JSON string with 'client_id' and 'client_secret' keys
-    adobe_secret_name = app_config["aws"]["secrets_manager"]["adobe_api_key_name"]
-    adobe_creds_str = aws.get_secret(adobe_secret_name)
-    if not adobe_creds_str:
-        logger.error("Failed to retrieve Adobe API credentials from Secrets Manager.")
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Could not fetch Adobe credentials"}),
-        }
+        return build_response(400, {"error": f"Invalid event data: {e}"})
 
-    try:
-        adobe_creds = json.loads(adobe_creds_str)
-        client_id = adobe_creds["client_id"]
-        client_secret = adobe_creds["client_secret"]
-    except (json.JSONDecodeError, KeyError):
-        logger.error("Adobe secret is not a valid JSON or is missing keys.")
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Malformed Adobe credentials secret"}),
-        }
+    # 2. Get the Adobe API client (authenticated during Lambda init)
+    adobe_client, adobe_error = _get_adobe_client()
+    if not adobe_client:
+        return build_response(500, {"error": adobe_error})
 
     # 3. Generate Pre-signed URLs for S3 assets
     # The template name could be dynamic based on event data in a future version
     template_name = "default_template.indt"
     output_name = f"{sku}_poster.pdf"
 
-    assets_bucket = app_config["aws"]["s3"]["assets_bucket_name"]
     outputs_bucket = app_config["aws"]["s3"]["outputs_bucket_name"]
 
-    template_url = aws.create_presigned_url(
-        assets_bucket, f"templates/{template_name}", method="GET"
-    )
-    output_url = aws.create_presigned_url(
-        outputs_bucket, f"generated/{output_name}", method="PUT"
-    )
-
-    if not template_url or not output_url:
+    # Both signers were built during init; signing is local and cannot fail.
+    if not _assets_signer or not _outputs_signer:
         logger.error("Failed to create one or more S3 pre-signed URLs.")
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Failed to generate S3 URLs"}),
-        }
+        return build_response(500, {"error": "Failed to generate S3 URLs"})
 
-    # 4. Initialize Adobe API Client and Submit Job
-    adobe_client = adobe.AdobeClient(client_id=client_id, client_secret=client_secret)
+    template_url = _assets_signer.presign(f"templates/{template_name}", "GET", 3600)
+    output_url = _outputs_signer.presign(f"generated/{output_name}", "PUT", 3600)
+
+    # 4. Submit the job to the Adobe API
     job_status_url = adobe_client.submit_rendition_job(
         template_url=template_url, output_url=output_url, data=row_data
     )
 
     if not job_status_url:
         logger.error("Failed to submit job to Adobe API.")
-        return {
-            "statusCode": 502,
-            "body": json.dumps(
-                {"error": "Bad Gateway: Adobe API job submission failed"}
-            ),
-        }
+        return build_response(
+            502, {"error": "Bad Gateway: Adobe API job submission failed"}
+        )
 
     # 5. Return the job status URL to the Inngest orchestrator
     # Inngest will use this URL in a `step.sleep()` and polling loop.
     logger.info(
         "Successfully submitted job to Adobe. Returning status URL to orchestrator."
     )
-    return {
-        "statusCode": 202,  # 202 Accepted, as the job is not yet complete
-        "body": json.dumps(
-            {
-                "message": "Job successfully submitted to Adobe API.",
-                "job_status_url": job_status_url,
-                "output_bucket": outputs_bucket,
-                "output_key": f"generated/{output_name}",
-            }
-        ),
-    }
+    # 202 Accepted, as the job is not yet complete
+    return build_response(
+        202,
+        {
+            "message": "Job successfully submitted to Adobe API.",
+            "job_status_url": job_status_url,
+            "output_bucket": outputs_bucket,
+            "output_key": f"generated/{output_name}",
+        },
+    )
@@ -1,17 +1,23 @@
 # src/lambdas/read_sheet/handler.py
 
-import json
-from typing import Any, Dict
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import orjson
 
 # Import our common modules
-from src.common import config, google, schema
-from src.common.logging import logger
+from src.common import aws, config, google, schema
+from src.common.logging import configure_logger, logger
+from src.common.responses import build_response
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 # ==============================================================================
-# Global Scope: Load configuration and schema once per container reuse
+# Global Scope: Load configuration once per container reuse
 # ==============================================================================
 # By loading these here, we leverage Lambda's container reuse for performance.
-# The configuration and schema will be loaded only on the first invocation
+# The configuration will be loaded only on the first invocation
 # (a "cold start") and will be available immediately for subsequent "warm"
 # invocations.
 
@@ -19,23 +25,54 @@ try:
     # Load environment-specific settings (dev.yaml, staging.yaml, etc.)
     app_config = config.load_config()
 
-    # Load the JSON schema for validating rows
-    schema_path = config.project_root / "schemas" / "product_row.schema.json"
-    with open(schema_path, "r") as f:
-        product_row_schema = json.load(f)
-
     # Inject service name and log level from config into the logger
-    logger.set_service(app_config["logging"]["powertools_service_name"])
-    logger.set_level(app_config["logging"]["level"])
+    configure_logger(
+        app_config["logging"]["powertools_service_name"],
+        app_config["logging"]["level"],
+    )
 
 except (ValueError, FileNotFoundError) as e:
     # If config fails to load, this is a fatal misconfiguration.
     # The Lambda cannot operate, so we log the error and prepare to fail invocations.
-    logger.error(
-        "FATAL: Could not load configuration or schema.", extra={"error": str(e)}
-    )
+    logger.error("FATAL: Could not load configuration.", extra={"error": str(e)})
     app_config = None
-    product_row_schema = None
+
+
+# Scopes requested for the Google credentials used to read the sheet
+GOOGLE_SCOPES = [google.DRIVE_READONLY_SCOPE, google.SHEETS_READONLY_SCOPE]
+
+
+def _get_google_credentials() -> Optional["Credentials"]:
+    """
+    Returns the Google credentials for this environment's service account.
+    `google.get_google_credentials` caches them per container and refreshes
+    the token only once it has expired.
+    """
+    # The email is fetched from our environment-specific config.
+    gcp_sa_email = app_config["aws"]["secrets_manager"][
+        "google_credentials_name"
+    ]  # We'll store the email here for simplicity
+    return google.get_google_credentials(
+        gcp_service_account_email=gcp_sa_email, scopes=GOOGLE_SCOPES
+    )
+
+
+# Do the AWS -> GCP credential exchange and build the Sheets service during
+# init, so that work is amortized over (or snapshotted with) the container
+# rather than paid by the first invocation. Failures are retried per invoke.
+if app_config:
+    try:
+        _init_creds = _get_google_credentials()
+        if _init_creds:
+            google.get_sheets_service(_init_creds)
+    except Exception as e:
+        logger.warning(
+            "Could not prepare Google clients at init.", extra={"error": str(e)}
+        )
+
+# Sheet values that mean "active". Cells are read formatted, so a checkbox or
+# boolean cell arrives as the string "TRUE"/"FALSE".
+_TRUTHY = frozenset({"TRUE", "true", "True", "1", "YES", "yes"})
 
 
 # ==============================================================================
@@ -52,7 +89,8 @@ def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
         This function is triggered by an Inngest event that contains information
         about a modified Google Sheet. It uses Workload Identity Federation to
         authenticate with Google, reads the sheet's content, validates each
-        row against a JSON schema, and returns a list of valid rows.
+        row against the product row schema, and writes the valid rows to S3
+        as newline-delimited JSON for the orchestrator to fan out.
 
     Args:
         event (Dict[str, Any]): The event payload from Inngest. It is expected
@@ -61,15 +99,12 @@ def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
 
     Returns:
         Dict[str, Any]: A dictionary containing a 'statusCode' and a 'body'
-                        with the list of valid data rows.
+                        with the s3:// URI of the valid rows and the row counts.
     """
     # Fail fast if the configuration was not loaded correctly
-    if not app_config or not product_row_schema:
+    if not app_config:
         logger.error("Handler cannot execute due to missing configuration.")
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Internal server configuration error"}),
-        }
+        return build_response(500, {"error": "Internal server configuration error"})
 
     # 1. Extract spreadsheet ID from the incoming Inngest event
     try:
@@ -77,64 +112,57 @@ def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
         logger.info(f"Processing request for spreadsheet ID: {spreadsheet_id}")
     except KeyError:
         logger.warning("Incoming event is missing 'data.file_id'.")
-        return {
-            "statusCode": 400,
-            "body": json.dumps({"error": "Missing file_id in event data"}),
-        }
+        return build_response(400, {"error": "Missing file_id in event data"})
 
     # 2. Get Google Credentials using Workload Identity Federation
-    # The email is fetched from our environment-specific config.
-    gcp_sa_email = app_config["aws"]["secrets_manager"][
-        "google_credentials_name"
-    ]  # We'll store the email here for simplicity
-    creds = google.get_google_credentials(
-        gcp_service_account_email=gcp_sa_email,
-        scopes=[google.DRIVE_READONLY_SCOPE, google.SHEETS_READONLY_SCOPE],
-    )
+    # Normally already created at init; refreshed here only once expired.
+    creds = _get_google_credentials()
     if not creds:
         logger.error("Failed to acquire Google credentials.")
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Failed to authenticate with Google"}),
-        }
+        return build_response(500, {"error": "Failed to authenticate with Google"})
 
     # 3. Read data from the Google Sheet
     # The range is hardcoded for now but could be made configurable.
     rows = google.read_google_sheet(creds, spreadsheet_id, sheet_range="A:Z")
     if rows is None:
         logger.error("Failed to read data from Google Sheet.")
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Failed to read sheet data"}),
-        }
-
-    # 4. Validate each row and collect valid/invalid rows
-    valid_rows = []
-    invalid_rows = []
+        return build_response(500, {"error": "Failed to read sheet data"})
+
+    # 4. Validate the rows and split them into valid/invalid
     for row in rows:
-        # The 'is_active' column from a sheet is often a string "TRUE" or "FALSE"
-        # We need to convert it to a boolean for schema validation.
+        # Only 'is_active' is typed as non-string in the schema, so it is the
+        # one column converted before validation.
         if "is_active" in row:
-            row["is_active"] = str(row["is_active"]).upper() == "TRUE"
+            row["is_active"] = row["is_active"] in _TRUTHY
 
-        if schema.validate_row_data(row, product_row_schema):
-            valid_rows.append(row)
-        else:
-            invalid_rows.append(row)
+    valid_rows, invalid_rows = schema.partition_product_rows(rows)
 
     logger.info(
         f"Validation complete. Valid rows: {len(valid_rows)}, Invalid rows: {len(invalid_rows)}."
     )
 
-    # 5. Return the list of valid rows for Inngest to process
-    # The orchestrator will use this output to fan out the generation jobs.
-    return {
-        "statusCode": 200,
-        "body": json.dumps(
-            {
-                "valid_rows": valid_rows,
-                "invalid_rows_count": len(invalid_rows),
-                "spreadsheet_id": spreadsheet_id,
-            }
-        ),
-    }
+    # 5. Write the valid rows to S3 as NDJSON and return a pointer to them.
+    # This keeps the response a constant size, well under Lambda's 6 MB
+    # payload limit, however large the sheet is.
+    valid_rows_s3 = None
+    if valid_rows:
+        outputs_bucket = app_config["aws"]["s3"]["outputs_bucket_name"]
+        valid_rows_key = f"runs/{spreadsheet_id}/{uuid.uuid4().hex}.ndjson"
+        ndjson = b"\n".join(map(orjson.dumps, valid_rows))
+        if not aws.put_object(
+            outputs_bucket, valid_rows_key, ndjson, "application/x-ndjson"
+        ):
+            return build_response(500, {"error": "Failed to store valid rows"})
+        valid_rows_s3 = f"s3://{outputs_bucket}/{valid_rows_key}"
+
+    # The orchestrator reads the rows from this object (with its own IAM role)
+    # to fan out the generation jobs.
+    return build_response(
+        200,
+        {
+            "valid_rows_s3": valid_rows_s3,
+            "valid_rows_count": len(valid_rows),
+            "invalid_rows_count": len(invalid_rows),
+            "spreadsheet_id": spreadsheet_id,
+        },
+    )
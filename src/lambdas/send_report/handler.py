@@ -1,31 +1,98 @@
 # src/lambdas/send_report/handler.py
 
-import json
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Optional
 
-import requests
+import orjson
+import urllib3
 
 # Import our common modules
 from src.common import aws, config
-from src.common.logging import logger
+from src.common.logging import configure_logger, logger
+from src.common.responses import build_response
 
 # ==============================================================================
 # Global Scope: Load configuration once per container reuse
 # ==============================================================================
 try:
     app_config = config.load_config()
-    logger.set_service(app_config["logging"]["powertools_service_name"])
-    logger.set_level(app_config["logging"]["level"])
+    configure_logger(
+        app_config["logging"]["powertools_service_name"],
+        app_config["logging"]["level"],
+    )
 except (ValueError, FileNotFoundError) as e:
     logger.error("FATAL: Could not load configuration.", extra={"error": str(e)})
     app_config = None
 
+# One pooled HTTPS connection to Slack, reused across warm invocations so each
+# report skips the TCP and TLS handshake. No retries: a failed notification is
+# logged and dropped rather than risking a duplicate message.
+_http = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=1,
+    retries=False,
+    timeout=urllib3.Timeout(connect=2.0, read=10.0),
+)
+
+
+# Slack message body, filled in with %-formatting per report
+_REPORT_TEMPLATE = """
+:art: *Event-Forge: Poster Generation Report* :art:
+
+A workflow has completed for Google Sheet: `%s`
+
+*Summary:*
+- :white_check_mark: *Successful Posters:* %d
+- :x: *Failed Posters:* %d
+- :warning: *Skipped Invalid Rows:* %d
+
+"""
+
+
+def _load_slack_url() -> Optional[str]:
+    """
+    Resolves the Slack webhook URL. A real SLACK_WEBHOOK_URL environment
+    variable wins (handy for local testing); otherwise the per-environment
+    secret 'event-forge/slack-webhook-url-<env>' is read from Secrets Manager.
+    """
+    env_url = os.environ.get("SLACK_WEBHOOK_URL")
+    if env_url and env_url != "unset":
+        return env_url
+    return aws.get_secret("event-forge/slack-webhook-url-" + app_config["environment"])
+
+
+# Fetched once per container so warm invocations skip Secrets Manager. If the
+# fetch fails here, the handler tries again on the next invocation.
+try:
+    _slack_url = _load_slack_url() if app_config else None
+except Exception as e:
+    logger.warning("Could not load Slack webhook URL at init.", extra={"error": str(e)})
+    _slack_url = None
+
+
+def _get_slack_url() -> Optional[str]:
+    """
+    Returns the container's Slack webhook URL, loading it again if the
+    init-time fetch failed. Failures are not cached, so the next invocation
+    tries again.
+    """
+    global _slack_url
+    if _slack_url is None:
+        try:
+            _slack_url = _load_slack_url()
+        except Exception as e:
+            logger.warning("Could not load Slack webhook URL.", extra={"error": str(e)})
+    return _slack_url
+
+
 # ==============================================================================
 # Lambda Handler
 # ==============================================================================
 
 
-@logger.inject_lambda_context(log_event=True)
+# The event carries every job result, so it is only logged when
+# POWERTOOLS_LOGGER_LOG_EVENT is set (dev).
+@logger.inject_lambda_context
 def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
     """
     AWS Lambda handler for sending a summary report of the generation process.
@@ -46,10 +113,7 @@ def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
     """
     if not app_config:
         logger.error("Handler cannot execute due to missing configuration.")
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Internal server configuration error"}),
-        }
+        return build_response(500, {"error": "Internal server configuration error"})
 
     # 1. Extract results from the incoming Inngest event
     try:
@@ -58,20 +122,45 @@ def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
         successful_jobs = results.get("successful_jobs", [])
         failed_jobs = results.get("failed_jobs", [])
         invalid_rows_count = results.get("invalid_rows_count", 0)
-        logger.info("Generating report.", extra={"results": results})
+        logger.info(
+            "Generating report.",
+            extra={
+                "spreadsheet_id": spreadsheet_id,
+                "successful": len(successful_jobs),
+                "failed": len(failed_jobs),
+                "invalid": invalid_rows_count,
+            },
+        )
+        logger.debug("Full report results.", extra={"results": results})
     except KeyError:
         logger.warning("Incoming event is missing 'data.results'.")
-        return {
-            "statusCode": 400,
-            "body": json.dumps({"error": "Missing results in event data"}),
-        }
-
-    # 2. Fetch the Slack Webhook URL from Secrets Manager
-    # We will need to create a secret named 'event-forge/slack-webhook-url-dev'
-    slack_webhook_secret_name = (
-        "event-forge/slack-webhook-url-" + app_config["environment"]
+        return build_response(400, {"error": "Missing results in event data"})
+
+    # Nothing happened in this run, so skip the Slack call entirely
+    if (
+        app_config.get("reporting", {}).get("skip_empty", False)
+        and not successful_jobs
+        and not failed_jobs
+        and not invalid_rows_count
+    ):
+        logger.info("Nothing to report; skipping Slack notification.")
+        return build_response(200, {"message": "Nothing to report."})
+
+    # 2. Format the Slack message
+    message_text = _REPORT_TEMPLATE % (
+        spreadsheet_id,
+        len(successful_jobs),
+        len(failed_jobs),
+        invalid_rows_count,
     )
-    slack_url = aws.get_secret(slack_webhook_secret_name)
+    if failed_jobs:
+        failed_skus = ", ".join(job.get("sku", "N/A") for job in failed_jobs)
+        message_text += "\n*Failed SKUs:* `%s`" % failed_skus
+
+    slack_payload = {"text": message_text}
+
+    # 3. Get the Slack Webhook URL, loaded at init on the happy path
+    slack_url = _get_slack_url()
 
     if not slack_url:
         logger.error(
@@ -79,44 +168,25 @@ def handler(event: Dict[str, Any], context: object) -> Dict[str, Any]:
         )
         # We return 200 OK because failing here could cause an infinite retry loop.
         # The core workflow succeeded; only the notification failed.
-        return {
-            "statusCode": 200,
-            "body": json.dumps({"warning": "Report could not be sent."}),
-        }
-
-    # 3. Format the Slack message
-    message_text = f"""
-:art: *Event-Forge: Poster Generation Report* :art:
-
-A workflow has completed for Google Sheet: `{spreadsheet_id}`
-
-*Summary:*
-- :white_check_mark: *Successful Posters:* {len(successful_jobs)}
-- :x: *Failed Posters:* {len(failed_jobs)}
-- :warning: *Skipped Invalid Rows:* {invalid_rows_count}
-
-"""
-    if failed_jobs:
-        failed_skus = ", ".join([job.get("sku", "N/A") for job in failed_jobs])
-        message_text += f"\n*Failed SKUs:* `{failed_skus}`"
-
-    slack_payload = {"text": message_text}
+        return build_response(200, {"warning": "Report could not be sent."})
 
     # 4. Send the report to Slack
     try:
         logger.info("Sending report to Slack.")
-        response = requests.post(slack_url, json=slack_payload, timeout=10)
-        response.raise_for_status()
+        response = _http.request(
+            "POST",
+            slack_url,
+            body=orjson.dumps(slack_payload),
+            headers={"Content-Type": "application/json"},
+        )
+        if not 200 <= response.status < 300:
+            raise urllib3.exceptions.HTTPError(
+                f"Slack responded with HTTP {response.status}"
+            )
         logger.info("Successfully sent report to Slack.")
-    except requests.exceptions.RequestException as e:
+    except urllib3.exceptions.HTTPError as e:
         logger.error("Failed to send report to Slack.", extra={"error": str(e)})
         # Again, return 200 OK to avoid retries on notification failure.
-        return {
-            "statusCode": 200,
-            "body": json.dumps({"warning": "Report could not be sent."}),
-        }
-
-    return {
-        "statusCode": 200,
-        "body": json.dumps({"message": "Report sent successfully."}),
-    }
+        return build_response(200, {"warning": "Report could not be sent."})
+
+    return build_response(200, {"message": "Report sent successfully."})
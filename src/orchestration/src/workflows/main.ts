@@ -6,6 +6,7 @@ import {
   GetSecretValueCommand,
   SecretsManagerClient,
 } from "@aws-sdk/client-secrets-manager";
+import { SignatureV4 } from "@smithy/signature-v4";
 import axios from "axios";
 import { NonRetriableError } from "inngest";
 
@@ -26,6 +27,49 @@ const secretsManagerClient = new SecretsManagerClient({ region: REGION });
 const textEncoder = new TextEncoder();
 const textDecoder = new TextDecoder();
 
+// Signs S3 reads with this Lambda's own role, reusing the credential chain and
+// hash implementation the Lambda client already resolved.
+const s3Signer = new SignatureV4({
+  service: "s3",
+  region: REGION,
+  credentials: lambdaClient.config.credentials,
+  sha256: lambdaClient.config.sha256,
+  uriEscapePath: false,
+});
+
+// Events are sent in batches to stay under Inngest's per-request payload limit.
+const FAN_OUT_BATCH_SIZE = 500;
+
+/**
+ * Read an NDJSON object (one JSON value per line) from an s3:// URI.
+ */
+async function readNdjsonFromS3(s3Uri: string): Promise<Record<string, any>[]> {
+  const match = /^s3:\/\/([^/]+)\/(.+)$/.exec(s3Uri);
+  const bucket = match?.[1];
+  const key = match?.[2];
+  if (!bucket || !key) {
+    throw new NonRetriableError(`Invalid S3 URI: ${s3Uri}`);
+  }
+  const hostname = `${bucket}.s3.${REGION}.amazonaws.com`;
+  const path = "/" + key.split("/").map(encodeURIComponent).join("/");
+  const signed = await s3Signer.sign({
+    method: "GET",
+    protocol: "https:",
+    hostname,
+    path,
+    headers: { host: hostname },
+  });
+  const res = await axios.get<string>(`https://${hostname}${path}`, {
+    headers: signed.headers,
+    responseType: "text",
+    transformResponse: (data) => data,
+  });
+  return res.data
+    .split("\n")
+    .filter((line) => line.length > 0)
+    .map((line) => JSON.parse(line) as Record<string, any>);
+}
+
 /**
  * Invoke a Lambda by convention name: event-forge-<fn>-<ENV>.
  */
@@ -76,37 +120,53 @@ export const fanOutAndGenerate = inngest.createFunction(
         );
       }
       return body as {
-        valid_rows: Record<string, any>[];
+        valid_rows_s3: string | null;
+        valid_rows_count: number;
         invalid_rows_count: number;
         spreadsheet_id: string;
       };
     });
 
-    const { valid_rows, invalid_rows_count, spreadsheet_id } = readResult;
+    const {
+      valid_rows_s3,
+      valid_rows_count,
+      invalid_rows_count,
+      spreadsheet_id,
+    } = readResult;
 
-    if (!Array.isArray(valid_rows) || valid_rows.length === 0) {
+    if (!valid_rows_s3 || !valid_rows_count) {
       return { message: "No valid rows found." };
     }
 
-    await step.sendEvent(
-      "2-fan-out-requests",
-      valid_rows.map((row) => ({
-        name: "poster/generate.request" as const,
-        data: { row_data: row, spreadsheet_id, run_id },
-      })),
-    );
+    // read-sheet writes the valid rows to S3 as NDJSON (one JSON object per
+    // line). They are read and fanned out inside a single step so the rows
+    // never land in Inngest's step state; only the count is returned. Event
+    // IDs are deterministic, so a retried step does not duplicate requests.
+    await step.run("2-fan-out-requests", async () => {
+      const valid_rows = await readNdjsonFromS3(valid_rows_s3);
+      for (let i = 0; i < valid_rows.length; i += FAN_OUT_BATCH_SIZE) {
+        await inngest.send(
+          valid_rows.slice(i, i + FAN_OUT_BATCH_SIZE).map((row, j) => ({
+            id: `${run_id}-row-${i + j}`,
+            name: "poster/generate.request" as const,
+            data: { row_data: row, spreadsheet_id, run_id },
+          })),
+        );
+      }
+      return { sent: valid_rows.length };
+    });
 
     await step.sendEvent("trigger-reporting-step", {
       name: "poster/reporting.requested",
       data: {
         spreadsheet_id,
-        total_jobs: valid_rows.length,
+        total_jobs: valid_rows_count,
         invalid_rows_count,
         run_id,
       },
     });
 
-    return { message: `Fanned out ${valid_rows.length} jobs.` };
+    return { message: `Fanned out ${valid_rows_count} jobs.` };
   },
 );
 
@@ -172,16 +232,27 @@ export const generatePoster = inngest.createFunction(
     } as const;
 
     let jobDetails: any = {};
+    let jobEtag: string | undefined;
     let adobeJobStatus = "running";
 
     while (adobeJobStatus === "running" || adobeJobStatus === "unstarted") {
       await step.sleep("4-wait-for-adobe", "10s");
-      jobDetails = await step.run("5-poll-adobe-status", async () => {
+      // Send the last ETag so an unchanged status comes back as a body-less
+      // 304; the previous status document is kept in that case.
+      const poll = await step.run("5-poll-adobe-status", async () => {
         const res = await axios.get(submissionResult.job_status_url, {
-          headers: pollingHeaders,
+          headers: jobEtag
+            ? { ...pollingHeaders, "If-None-Match": jobEtag }
+            : pollingHeaders,
+          validateStatus: (s) => (s >= 200 && s < 300) || s === 304,
         });
-        return res.data;
+        return {
+          etag: (res.headers["etag"] as string | undefined) ?? jobEtag,
+          data: res.status === 304 ? null : res.data,
+        };
       });
+      if (poll.data) jobDetails = poll.data;
+      jobEtag = poll.etag;
       adobeJobStatus = jobDetails.status;
     }
 